@@ -0,0 +1,182 @@
+"""
+Optional numba-compiled unfilter kernels for the decode hot path.
+
+numba is not a hard requirement; when it isn't importable `get_unfilter`
+returns None and the decoder falls back to the numpy scanline path in
+Transformer. Kernels are generated per bytes-per-pixel value by closing over
+`bpp`, so numba sees it as a compile-time constant and LLVM can unroll and
+pipeline the Sub/Average/Paeth recurrences by the (fixed) dependency
+distance - the decoder only ever asks for bpp=4, which compiles exactly once.
+
+The kernels work on the same buffer layout as the numpy path: `raw` is the
+inflated datastream reshaped to (height, stride + 1) with the filter byte in
+column zero, and `out` is (height + 1, stride + bpp) with a zero top row and a
+bpp-wide zero left column so neighbour reads never branch on boundaries.
+"""
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_kernel_cache: dict[int, object] = {}
+
+
+STRIP_ROWS = 8
+
+
+def _make_unfilter(bpp: int):
+    def _pack32(buf, r, i):
+        return (
+            np.uint32(buf[r, i])
+            | (np.uint32(buf[r, i + 1]) << np.uint32(8))
+            | (np.uint32(buf[r, i + 2]) << np.uint32(16))
+            | (np.uint32(buf[r, i + 3]) << np.uint32(24))
+        )
+
+    def _store32(buf, r, i, v):
+        buf[r, i] = v & np.uint32(0xFF)
+        buf[r, i + 1] = (v >> np.uint32(8)) & np.uint32(0xFF)
+        buf[r, i + 2] = (v >> np.uint32(16)) & np.uint32(0xFF)
+        buf[r, i + 3] = (v >> np.uint32(24)) & np.uint32(0xFF)
+
+    def _swar_add(a, b):
+        # Per-lane modular add of four packed bytes: sum the low 7 bits of
+        # each lane, then xor the lane MSBs back in - addition with the
+        # inter-lane carry surgically removed.
+        sum7 = (a & np.uint32(0x7F7F7F7F)) + (b & np.uint32(0x7F7F7F7F))
+        return sum7 ^ ((a ^ b) & np.uint32(0x80808080))
+
+    def _paeth_byte(raw, out, h, i):
+        a = np.int32(out[h, i])
+        b = np.int32(out[h - 1, bpp + i])
+        c = np.int32(out[h - 1, i])
+        # Difference-identity Paeth, see Filters.paeth_predictor. The
+        # selection is a running-minimum chain rather than nested
+        # comparisons - each step is a pair of conditional moves, which LLVM
+        # keeps branchless (Paeth branches are near-random on photographic
+        # data). Strict < preserves the spec's a-then-b tie-breaking.
+        pa = abs(b - c)
+        pb = abs(a - c)
+        pc = abs((b - c) + (a - c))
+        pred = a
+        if pb < pa:
+            pred = b
+            pa = pb
+        if pc < pa:
+            pred = c
+        out[h, bpp + i] = (raw[h - 1, 1 + i] + pred) & 0xFF
+
+    if njit is not None:
+        _pack32 = njit(inline="always", boundscheck=False)(_pack32)
+        _store32 = njit(inline="always", boundscheck=False)(_store32)
+        _swar_add = njit(inline="always", boundscheck=False)(_swar_add)
+        _paeth_byte = njit(inline="always", boundscheck=False)(_paeth_byte)
+
+    def _unfilter(raw, out):
+        height = raw.shape[0]
+        stride = raw.shape[1] - 1
+        n_pixels = stride // bpp
+        h = 1
+        while h <= height:
+            filter_byte = raw[h - 1, 0]
+            if filter_byte == 0:
+                for i in range(stride):
+                    out[h, bpp + i] = raw[h - 1, 1 + i]
+                h += 1
+            elif filter_byte == 1:
+                if bpp == 4:
+                    # The left-dependency is per pixel, not per byte, so with
+                    # bpp=4 the whole pixel rides in one uint32 and a single
+                    # SWAR add replaces four byte adds (bpp is a compile-time
+                    # constant, so the other arm of this branch folds away).
+                    prev = np.uint32(0)
+                    for i in range(0, stride, 4):
+                        prev = _swar_add(prev, _pack32(raw, h - 1, 1 + i))
+                        _store32(out, h, bpp + i, prev)
+                else:
+                    for i in range(stride):
+                        out[h, bpp + i] = (raw[h - 1, 1 + i] + out[h, i]) & 0xFF
+                h += 1
+            elif filter_byte == 2:
+                for i in range(stride):
+                    out[h, bpp + i] = (raw[h - 1, 1 + i] + out[h - 1, bpp + i]) & 0xFF
+                h += 1
+            elif filter_byte == 3:
+                if bpp == 4:
+                    # floor((a + b) / 2) per lane via the carry-free bitwise
+                    # average: (a & b) + ((a ^ b) >> 1), with the shifted-in
+                    # neighbour-lane bit masked off.
+                    prev = np.uint32(0)
+                    for i in range(0, stride, 4):
+                        b32 = _pack32(out, h - 1, bpp + i)
+                        avg = (prev & b32) + (
+                            ((prev ^ b32) >> np.uint32(1)) & np.uint32(0x7F7F7F7F)
+                        )
+                        prev = _swar_add(avg, _pack32(raw, h - 1, 1 + i))
+                        _store32(out, h, bpp + i, prev)
+                else:
+                    for i in range(stride):
+                        a = np.int32(out[h, i])
+                        b = np.int32(out[h - 1, bpp + i])
+                        out[h, bpp + i] = (raw[h - 1, 1 + i] + ((a + b) >> 1)) & 0xFF
+                h += 1
+            elif filter_byte == 4:
+                # Paeth's (a, b, c) dependency chain serialises a single row,
+                # but pixels along an anti-diagonal of a strip of rows are
+                # mutually independent: (r, p) needs (r, p-1) and (r-1, p) from
+                # the previous diagonal and (r-1, p-1) from two back. So runs
+                # of Paeth rows are processed STRIP_ROWS at a time on a
+                # diagonal wavefront, giving LLVM an independent inner lane
+                # loop to vectorize. Short runs and remainders go row-at-a-time.
+                run = 1
+                while h + run <= height and raw[h + run - 1, 0] == 4:
+                    run += 1
+                # The wavefront handles any strip height: a full STRIP_ROWS
+                # where the run allows, whatever is left otherwise (a 1-row
+                # strip degenerates to the plain scalar row walk), so short
+                # runs and remainders share this loop instead of a separate
+                # scalar path.
+                done = 0
+                while done < run:
+                    rows = run - done
+                    if rows > STRIP_ROWS:
+                        rows = STRIP_ROWS
+                    base = h + done
+                    for d in range(n_pixels + rows - 1):
+                        r_lo = d - n_pixels + 1
+                        if r_lo < 0:
+                            r_lo = 0
+                        r_hi = d + 1
+                        if r_hi > rows:
+                            r_hi = rows
+                        for r in range(r_lo, r_hi):
+                            i0 = (d - r) * bpp
+                            for k in range(bpp):
+                                _paeth_byte(raw, out, base + r, i0 + k)
+                    done += rows
+                h += run
+            else:
+                # Can't raise from inside the jitted loop without killing
+                # performance, so hand the offending row back to the caller.
+                return h - 1
+        return -1
+
+    return _unfilter
+
+
+def get_unfilter(bpp: int):
+    """
+    Returns the jitted unfilter kernel specialized for bpp, compiling it on
+    first request, or None when numba isn't available.
+    """
+    if njit is None:
+        return None
+    kernel = _kernel_cache.get(bpp)
+    if kernel is None:
+        kernel = njit(boundscheck=False)(_make_unfilter(bpp))
+        _kernel_cache[bpp] = kernel
+    return kernel
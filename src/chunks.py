@@ -1,18 +1,33 @@
 from __future__ import annotations
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 from typing import NamedTuple, Self
 import struct
 import zlib
 
 
-class IHDR(NamedTuple):
+@lru_cache(maxsize=32)
+def _type_crc(chunk_type: bytes) -> int:
+    # The 4-byte type is already exactly what prefixes a chunk CRC - the old
+    # struct.pack(">4s", ...) round-trip was a no-op copy. Cached per distinct
+    # type so repeat hashing of b"IDAT" etc. is a dict hit.
+    return zlib.crc32(chunk_type)
+
+
+@dataclass(frozen=True)
+class IHDR:
     length: int
     chunk_type: bytes
     chunk_data: bytes
 
-    @property
+    # Parsed once per header - the old property re-ran struct.unpack and a
+    # NamedTuple construction on every access, which adds up when dimensions
+    # get read inside loops.
+    @cached_property
     def ihdr_data(self) -> IHDRData:
         return IHDRData.from_bytes(self.chunk_data)
-    
+
     @property
     def dimensions(self) -> tuple[int, int]:
         return self.ihdr_data.dimensions
@@ -39,12 +54,45 @@ class IHDRData(NamedTuple):
         return self.width, self.height
 
 
+@dataclass
+class ChunkTable:
+    """
+    Structure-of-arrays storage for a parsed chunk stream. Most call sites only
+    want one field per chunk, so four parallel arrays beat a list of Chunk
+    objects: one object header per table instead of one per chunk, and the
+    CRCs pack into an array('I'). Chunk objects are only materialised on
+    demand for the serialisation path.
+    """
+    lengths: list[int] = field(default_factory=list)
+    types: list[bytes] = field(default_factory=list)
+    datas: list[bytes | memoryview] = field(default_factory=list)
+    crcs: array = field(default_factory=lambda: array("I"))
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def append(self, length: int, chunk_type: bytes, chunk_data: bytes | memoryview, crc: int):
+        self.lengths.append(length)
+        self.types.append(chunk_type)
+        self.datas.append(chunk_data)
+        self.crcs.append(crc)
+
+    def remove_range(self, start: int, stop: int):
+        del self.lengths[start:stop]
+        del self.types[start:stop]
+        del self.datas[start:stop]
+        del self.crcs[start:stop]
+
+    def chunk(self, idx: int) -> Chunk:
+        return Chunk(self.lengths[idx], self.types[idx], self.datas[idx], self.crcs[idx])
+
+
 class Chunk:
     length: int
-    chunk_type: str
-    chunk_data: bytes
-    crc:int
-    def __init__(self, length: int, chunk_type: str, chunk_data: bytes, crc: int) -> None:
+    chunk_type: bytes
+    chunk_data: bytes | memoryview
+    crc: int
+    def __init__(self, length: int, chunk_type: bytes, chunk_data: bytes | memoryview, crc: int) -> None:
         self.length = length
         self.chunk_type = chunk_type
         self.chunk_data = chunk_data
@@ -54,21 +102,20 @@ class Chunk:
         l = struct.pack(">I", self.length)
         ct = struct.pack(">4s", self.chunk_type)
         crc = struct.pack(">I", self.crc)
-        b = l + ct + self.chunk_data + crc
+        b = l + ct + bytes(self.chunk_data) + crc
         return b
         
     def combine_chunks(self, chunk_b: Self):
+        # CRCs stream: continuing from the left half's CRC over just the right
+        # half's payload equals hashing the concatenation from scratch, so the
+        # merged data never gets re-hashed.
+        self.crc = zlib.crc32(chunk_b.chunk_data, self.crc)
         self.chunk_data = b''.join([self.chunk_data, chunk_b.chunk_data])
         self.length += chunk_b.length
-        self.crc = zlib.crc32(
-            self.chunk_data, zlib.crc32(struct.pack(">4s", self.chunk_type))
-        )
 
     @staticmethod
     def calc_crc(chunk_data, chunk_type) -> int:
-        return zlib.crc32(
-            chunk_data, zlib.crc32(struct.pack(">4s", chunk_type))
-        )
+        return zlib.crc32(chunk_data, _type_crc(chunk_type))
     
     def __add__(self, other):
         self.combine_chunks(other)
\ No newline at end of file
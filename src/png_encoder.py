@@ -1,43 +1,22 @@
 from typing import Generator
 import zlib
+import numpy as np
 from src.chunks import IHDR, Chunk, IHDRData
-from src.filters import Filters
-from src.png_decoder import Transformer
-from src.square import Square
 
 
 def gen_lines(width, source_data) -> Generator[bytearray, None, None]:
-    line_bytes = bytearray()
-    for i in range(0, len(source_data), width):
-        line = source_data[i:i+width]
-        for rgba in line:
-            line_bytes.extend(rgba)
-        
-        yield line_bytes
-        
-        line_bytes.clear()
-        
+    # One numpy conversion for the whole source instead of extending a
+    # bytearray four bytes at a time per pixel; rows come off the 2D view.
+    pixels = np.asarray(source_data, dtype=np.uint8).reshape(-1, width * 4)
+    for row in pixels:
+        yield bytearray(row.tobytes())
+
 def gen_line_pairs(width, stride, source_data) -> Generator[tuple[bytearray, bytearray], None, None]:
-    line_buf = (bytearray(b'\x00'*stride),)
+    prev = bytearray(stride)
     for line in gen_lines(width, source_data):
-        line_buf += (line,)
-        if line_buf[2:]:
-            line_buf = line_buf[1:]
-        yield line_buf
-        
-def consume_lines(width, stride, source_data, filter_func, filter_byte):
-    
-    for prev, current in gen_line_pairs(width, stride, source_data):
-        scan_src = prev + current
+        yield prev, line
+        prev = line
         
-        filtered_data = bytearray(b'\x00') + bytearray(stride)
-        filtered_data += bytearray([filter_byte])
-        while next_square := Square.next_filter_square(scan_src, filtered_data, stride, 4):
-            filtered_data.append(filter_func(next_square) & 0xFF)
-        filtered_scanline = filtered_data[stride+1:]
-        
-        yield filtered_scanline
-
 
 class PNGEncoder:
     raw_source: list[tuple[int, int, int, int]]
@@ -49,13 +28,14 @@ class PNGEncoder:
         self.height = wh[1]
         self.bytes_per_pixel = 4
         self.stride = self.width * self.bytes_per_pixel # stride is width in terms of bytes per pixel
+        # Converted once: everything downstream works on flat uint8 rows, so
+        # the pixel tuples never get walked again.
+        self._pixels = np.asarray(self.raw_source, dtype=np.uint8).reshape(
+            self.height, self.stride
+        )
 
     def _source_to_byte_array(self) -> bytearray:
-        arr = bytearray()
-        for t in self.raw_source:
-            arr.extend(t)
-        
-        return arr
+        return bytearray(self._pixels.tobytes())
     
     def prepare_ihdr(self) -> Chunk:
         bit_depth = 8
@@ -83,39 +63,64 @@ class PNGEncoder:
         return chunked
     
     def apply_filtering(self) -> bytearray:
-        source_bytes = self._source_to_byte_array()
-        filter_bytes = self._best_filters()
-        filtered_data = Transformer.filter(source_bytes, filter_bytes, self.stride, self.bytes_per_pixel)
-        return filtered_data
+        """
+        Scores and filters in one pass. The old pipeline re-filtered the whole
+        image once per candidate filter type to score it, then a sixth time
+        with the winners; here all five candidate filtered images come out of
+        one set of whole-image numpy ops, each row's winner is the argmin of
+        the per-row sum of absolute (signed) filtered bytes, and the winning
+        rows are gathered straight into the output - nothing is computed twice.
+        """
+        bpp = self.bytes_per_pixel
+        stride = self.stride
+        src = self._pixels
+        a = np.zeros_like(src)
+        a[:, bpp:] = src[:, :-bpp]
+        b = np.zeros_like(src)
+        b[1:] = src[:-1]
+        c = np.zeros_like(src)
+        c[1:, bpp:] = src[:-1, :-bpp]
+
+        candidates = np.empty((5, self.height, stride), dtype=np.uint8)
+        candidates[0] = src
+        candidates[1] = src - a
+        candidates[2] = src - b
+        candidates[3] = src - ((a.astype(np.uint16) + b) >> 1).astype(np.uint8)
+        aa, bb, cc = (m.astype(np.int16) for m in (a, b, c))
+        pa, pb = np.abs(bb - cc), np.abs(aa - cc)
+        pc = np.abs((bb - cc) + (aa - cc))
+        pred = np.where((pa <= pb) & (pa <= pc), aa, np.where(pb <= pc, bb, cc))
+        candidates[4] = src - pred.astype(np.uint8)
+
+        # Minimum sum of absolute differences heuristic; argmin's first-wins
+        # tie-breaking favours the cheaper filter types.
+        sad = np.abs(candidates.view(np.int8).astype(np.int16)).sum(axis=2)
+        best = sad.argmin(axis=0)
+
+        filtered = np.empty((self.height, stride + 1), dtype=np.uint8)
+        filtered[:, 0] = best
+        filtered[:, 1:] = candidates[best, np.arange(self.height)]
+        return bytearray(filtered.tobytes())
 
     def _compress_to_idat_chunks(self, filtered_data) -> list[Chunk]:
-        arr = bytearray()
-        arr.extend(zlib.compress(filtered_data))
-            
-        max_size = 30
-        
+        # libpng's default IDAT size. The old 30-byte cap framed and CRC'd
+        # thousands of chunks per image, and its arr[i:-1] tail slice silently
+        # dropped the final compressed byte.
+        max_size = 1 << 15
+        arr = memoryview(zlib.compress(filtered_data))
+
         chunks = []
         for i in range(0, len(arr), max_size):
-            if len(arr) > max_size:
-                chunks.append(
-                    Chunk(
-                        length=max_size,
-                        chunk_type=b'IDAT',
-                        chunk_data=arr[i:i+max_size],
-                        crc=Chunk.calc_crc(arr[i:i+max_size],b'IDAT')
-                    )
+            piece = arr[i : i + max_size]
+            chunks.append(
+                Chunk(
+                    length=len(piece),
+                    chunk_type=b'IDAT',
+                    chunk_data=piece,
+                    crc=Chunk.calc_crc(piece, b'IDAT'),
                 )
-            else:
-                chunks.append(
-                    Chunk(
-                        length=len(arr[i:-1]),
-                        chunk_type=b'IDAT',
-                        chunk_data=arr[i:-1],
-                        crc=Chunk.calc_crc(arr[i:-1], b'IDAT')
-                    )
-                )                
-                break
-        
+            )
+
         return chunks
     
     def iend_chunk(self) -> Chunk:
@@ -128,31 +133,12 @@ class PNGEncoder:
             self.iend_chunk()
         ]
         
-        d = b''.join([bytes(chunk) for chunk in chunks])
-        d = self.PNG_SIGNATURE + d
-        
-        return d
+        # Signature included in the join - prepending it afterwards re-copied
+        # the whole assembled stream once more.
+        return b''.join([self.PNG_SIGNATURE, *(bytes(chunk) for chunk in chunks)])
     
     @staticmethod
     def to_file(fp, final_datastream):
         with open(fp, "wb") as file:
             file.write(final_datastream)
     
-    def _best_filters(self) -> list[int]:
-        scores = self._filter_scores()
-        filter_bytes = []
-        for score in scores:
-            filter_bytes.append(score.index(min(score)))
-        
-        return filter_bytes
-
-    def _filter_scores(self) -> list[tuple[int,int,int,int,int]]:
-        return [
-            *zip(self._calculate_filter_score(i) for i in range(5))
-        ]
-
-    def _calculate_filter_score(self, filter_byte:int) -> list[int]:
-        b = bytearray()
-        for line in consume_lines(self.width, self.stride, self.raw_source, Filters.select_filter_func(filter_byte), filter_byte):
-            b.extend(line)
-        return Filters.minumum_sum_of_absolute_differences(b, self.stride)
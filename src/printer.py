@@ -1,5 +1,4 @@
 from typing import Generator
-from itertools import count
 
 
 PixelStream = Generator[tuple[int,int,int,int], None, None]
@@ -31,26 +30,19 @@ class Printer:
         
     @staticmethod
     def pop_rgba(data: bytearray) -> PixelStream:
-        buf = []
-        while data:
-            buf.append(data.pop(0))
-            if len(buf) >= 4:
-                rgba = tuple(buf)
-                buf.clear()
-                yield rgba
-    
+        # Index walk instead of data.pop(0): popping the front shifts every
+        # remaining byte, which made this quadratic in the number of pixels.
+        mv = memoryview(data)
+        for i in range(0, len(mv) - 3, 4):
+            yield (mv[i], mv[i + 1], mv[i + 2], mv[i + 3])
+
     def enumerate_rows(self, data: bytearray, dimensions: tuple[int, int]) -> ScanLineStream:
         w, _ = dimensions
         scan_len = self.px_bytes * w
-        remaining_data = data.copy()
-        for i in count():
-            if not remaining_data:
-                break
-            
-            scan_up_to = min(scan_len, len(remaining_data))
-            output, remaining_data = remaining_data[:scan_up_to], remaining_data[scan_up_to:]
-            
-            yield (i, Printer.pop_rgba(output))
+        # One slice per row by offset - no upfront copy of the whole image and
+        # no repeated head/tail splitting.
+        for i, start in enumerate(range(0, len(data), scan_len)):
+            yield (i, Printer.pop_rgba(data[start : start + scan_len]))
             
     def print(self, image: bytearray, dims: tuple[int, int]):
         # This prints column numbers
@@ -1,4 +1,4 @@
-from typing import NamedTuple, Self, Generator
+from typing import NamedTuple, Self
 
 class Square(NamedTuple):
     x: int
@@ -29,83 +29,66 @@ class Square(NamedTuple):
         c_offsets = (scan_offset - scan_incr, line_offset - line_incr)
         
         filter_stride = stride + 1
-        
-        #                       go down by line offset scans          skip filter byte
-        #                                             |----------|    v
-        filter_byte_index = lambda scan, line: line * filter_stride + 1 + scan
-        recon_byte_index = lambda scan, line: line * stride + scan
-        
-        if filter_byte_index(*x_offsets) >= len(filter_data):
+
+        # Index maths inlined - building two lambdas per byte meant a closure
+        # allocation and an extra call frame for every neighbour read.
+        # Filter data rows are filter_stride wide with the filter byte first;
+        # recon rows are stride wide.
+        if line_offset * filter_stride + 1 + scan_offset >= len(filter_data):
             return None
-        
-        x = filter_data[filter_byte_index(*x_offsets)]
-        
+
+        x = filter_data[line_offset * filter_stride + 1 + scan_offset]
+
         a = 0
-        rec_idx_a = recon_byte_index(*a_offsets)
         if a_offsets[0] >= 0:
-            a = recon_data[rec_idx_a]
-        
+            a = recon_data[a_offsets[1] * stride + a_offsets[0]]
+
         b = 0
-        rec_idx_b = recon_byte_index(*b_offsets)
         if b_offsets[1] >= 0:
-            b = recon_data[rec_idx_b]
-        
+            b = recon_data[b_offsets[1] * stride + b_offsets[0]]
+
         c = 0
-        rec_idx_c = recon_byte_index(*c_offsets)
         if c_offsets[0] >= 0 and c_offsets[1] >= 0:
-            c = recon_data[rec_idx_c]
-            
+            c = recon_data[c_offsets[1] * stride + c_offsets[0]]
+
         return cls(x, a, b, c)
 
     @classmethod
     def next_filter_square(cls, source_data: bytearray, filtered_data: bytearray, stride: int, bytes_per_pixel: int) -> Self | None:
-        source_byte_index = lambda scan, line: line * stride + scan
-        
         scan_offset, line_offset = cls.filtered_data_offsets(filtered_data, stride)
         scan_incr = bytes_per_pixel
+        # a/c sit a whole pixel back along the scanline, but b/c are exactly
+        # one scanline up - stepping rows by scan_incr walked bpp rows up.
         x_offsets = (scan_offset, line_offset)
         a_offsets = (scan_offset - scan_incr, line_offset)
-        b_offsets = (scan_offset, line_offset - scan_incr)
-        c_offsets = (scan_offset - scan_incr, line_offset - scan_incr)
+        b_offsets = (scan_offset, line_offset - 1)
+        c_offsets = (scan_offset - scan_incr, line_offset - 1)
 
-        if source_byte_index(*x_offsets) >= len(source_data):
+        if line_offset * stride + scan_offset >= len(source_data):
             return None
-        
-        x = source_data[source_byte_index(*x_offsets)]
-        
+
+        x = source_data[line_offset * stride + scan_offset]
+
         a = 0
         if a_offsets[0] >= 0:
-            a = source_data[source_byte_index(*a_offsets)]
-        
+            a = source_data[a_offsets[1] * stride + a_offsets[0]]
+
         b = 0
         if b_offsets[1] >= 0:
-            b = source_data[source_byte_index(*b_offsets)]
-        
+            b = source_data[b_offsets[1] * stride + b_offsets[0]]
+
         c = 0
         if c_offsets[0] >= 0 and c_offsets[1] >= 0:
-            c = source_data[source_byte_index(*c_offsets)]
-            
+            c = source_data[c_offsets[1] * stride + c_offsets[0]]
+
         return cls(x, a, b, c)
         
     @classmethod
     def filtered_data_offsets(cls, filtered_data: bytearray, stride: int) -> tuple[int, int]:
-        filter_stride = stride + 1
-        scan_offset = max((len(filtered_data) % filter_stride) - 1, 0)
-        line_offset = len(filtered_data) // filter_stride
-        return scan_offset, line_offset
+        # One divmod gives both results from a single division.
+        line_offset, scan_offset = divmod(len(filtered_data), stride + 1)
+        return max(scan_offset - 1, 0), line_offset
     
     @classmethod
     def is_scan_start(cls, filtered_data: bytearray, stride: int) -> bool:
         return cls.filtered_data_offsets(filtered_data, stride)[0] == 0
-
-    @classmethod
-    def iter_source_scanline(cls, source_data: bytearray, filtered_data: bytearray, stride: int) -> Generator[Self, None, None]:
-        scan_offset, line_offset = cls.filtered_data_offsets(filtered_data, stride)
-        if not cls.is_scan_start(filtered_data, stride):
-            raise ValueError(f"We are trying to yield a scanline but the data has lenth implying a non-zero scan offset of {scan_offset}")
-        
-        yield cls.next_filter_square(source_data, filtered_data, stride)
-        
-        while not cls.is_scan_start(filtered_data, stride):
-            yield cls.next_filter_square(source_data, filtered_data, stride)
-            
\ No newline at end of file
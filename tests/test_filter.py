@@ -94,6 +94,27 @@ def test_recon_is_filter_inverse_varying_filters(filter_byte_pattern):
     )
 
     
+@pytest.mark.parametrize(["filter_byte_pattern"], (
+    ([0,1,2,3,4],),
+    ([4,4,4],),
+))
+def test_reconstruct_buf_matches_reference(filter_byte_pattern):
+    # Arrange
+    stride = 12
+    bytes_per_pixel = 4
+    source_data = image_fixture()
+    filter_data = Transformer.filter(source_data, filter_byte_pattern, stride, bytes_per_pixel)
+
+    # Act
+    recon_data = Transformer(stride // bytes_per_pixel, 3).reconstruct_buf(bytes(filter_data))
+
+    # Assert
+    # The old per-pixel `assert recon_x >= 0` lives here now: uint8 maths can't
+    # go negative, and the fast path must agree with the reference byte-for-byte.
+    assert all(0 <= byte <= 255 for byte in recon_data)
+    assert recon_data == source_data
+
+
 def test_filter_next_square():
     # Arrange
     stride = 12
@@ -103,7 +124,7 @@ def test_filter_next_square():
     bytes_per_pixel = 4
     # Act
     square = Square.next_filter_square(source_data, filter_data, stride, bytes_per_pixel)
-    filter_output = Filters.select_filter_func(filter_byte)(square)
+    filter_output = Filters.select_filter_func(filter_byte)(*square)
     
     # Assert
     assert square == Square(x=source_data[0], a=0, b=0, c=0)
@@ -118,11 +139,13 @@ def test_filter_next_next_square():
     bytes_per_pixel = 4
     # Act
     square = Square.next_filter_square(source_data, filter_data, stride, bytes_per_pixel)
-    filter_output = Filters.select_filter_func(filter_byte)(square)
+    filter_output = Filters.select_filter_func(filter_byte)(*square)
     
     # Assert
-    assert square == Square(x=source_data[1], a=source_data[0], b=0, c=0)
-    assert filter_output == source_data[1] - source_data[0]
+    # a is the byte one whole pixel (bytes_per_pixel) to the left, so inside
+    # the first pixel it's still the implicit zero, not source_data[0].
+    assert square == Square(x=source_data[1], a=0, b=0, c=0)
+    assert filter_output == source_data[1]
     
 def test_filter_next_next_next_square():
     # Arrange
@@ -133,7 +156,7 @@ def test_filter_next_next_next_square():
     bytes_per_pixel = 4
     # Act
     square = Square.next_filter_square(source_data, filter_data, stride, bytes_per_pixel)
-    filter_output = Filters.select_filter_func(filter_byte)(square)
+    filter_output = Filters.select_filter_func(filter_byte)(*square)
     
     # Assert
     assert square == Square(x=source_data[2], a=source_data[1], b=0, c=0)